@@ -1,23 +1,52 @@
 """Pytest configuration and fixtures for E2E tests."""
 
 import asyncio
+import functools
 import os
 import uuid
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 import pytest
 import pytest_asyncio
 
-from .helpers import TmuxSession, FreezeCapture, LLMJudge, IterationCapture
+from .helpers import TmuxSession, TmuxSessionPool, FreezeCapture, LLMJudge, IterationCapture
 
 
 # Configure pytest-asyncio
 pytest_plugins = ("pytest_asyncio",)
 
 
+def _xdist_worker_id() -> Optional[str]:
+    """Get the pytest-xdist worker id (e.g. "gw0"), or None when not sharded.
+
+    The suite is wait-bound and can be sharded by file:
+        pytest -n auto --dist=loadfile tools/e2e/
+    Anything written to a shared path is namespaced by this id so workers
+    don't clobber each other.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+@functools.lru_cache(maxsize=1)
+def _root_file_names(project_root: Path) -> frozenset[str]:
+    """List the regular files in the project root with a single directory read."""
+    with os.scandir(project_root) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+def pytest_addoption(parser):
+    """Register E2E command line options."""
+    parser.addoption(
+        "--serial",
+        action="store_true",
+        default=False,
+        help="run the per-probe variants instead of the concurrent probe test",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
@@ -35,6 +64,41 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: mark test as slow-running (requires live Ralph)"
     )
+    config.addinivalue_line(
+        "markers", "serial: mark test as a per-probe variant of the concurrent probe test"
+    )
+    config.addinivalue_line(
+        "markers", "concurrent_probes: mark test as running all probes concurrently"
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Pick between the concurrent probe test and its serial variants.
+
+    Runs after -m/-k deselection. The serial variants are skipped only when
+    the concurrent test is selected and every tool it needs is available;
+    otherwise they run so each probe is still covered (or skipped by name).
+    """
+    concurrent = [item for item in items if "concurrent_probes" in item.keywords]
+
+    if config.getoption("--serial"):
+        skip_concurrent = pytest.mark.skip(reason="--serial runs the per-probe variants instead")
+        for item in concurrent:
+            item.add_marker(skip_concurrent)
+        return
+
+    if not concurrent or not (
+        TmuxSession.is_available()
+        and FreezeCapture.is_available()
+        and LLMJudge.is_available()
+    ):
+        return
+
+    skip_serial = pytest.mark.skip(reason="covered by the concurrent probe test; use --serial")
+    for item in items:
+        if "serial" in item.keywords:
+            item.add_marker(skip_serial)
 
 
 @pytest.fixture(scope="session")
@@ -57,41 +121,61 @@ def ralph_binary(project_root: Path) -> Path:
         pytest.skip("Ralph binary not found. Run 'cargo build' first.")
 
 
+@pytest.fixture(scope="session")
+def run_timestamp() -> str:
+    """Timestamp shared by every evidence directory created in this session."""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
 @pytest.fixture(scope="session")
 def evidence_base_dir(project_root: Path) -> Path:
     """Get the base evidence directory."""
     evidence_dir = project_root / "tui-validation" / "idle-timeout"
+    worker_id = _xdist_worker_id()
+    if worker_id:
+        evidence_dir = evidence_dir / worker_id
     evidence_dir.mkdir(parents=True, exist_ok=True)
     return evidence_dir
 
 
-@pytest.fixture
-def evidence_dir(evidence_base_dir: Path) -> Path:
-    """Get a timestamped evidence directory for this test run."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_dir = evidence_base_dir / f"run_{timestamp}"
+@pytest.fixture(scope="session")
+def evidence_dir(evidence_base_dir: Path, run_timestamp: str) -> Path:
+    """Get the timestamped evidence directory for this test run.
+
+    Shared by every test in the session so they land in one run directory.
+    """
+    run_dir = evidence_base_dir / f"run_{run_timestamp}"
     run_dir.mkdir(parents=True, exist_ok=True)
     return run_dir
 
 
-@pytest.fixture
-def tmux_session_name() -> str:
-    """Generate a unique tmux session name."""
-    return f"ralph-e2e-{uuid.uuid4().hex[:8]}"
-
-
-@pytest_asyncio.fixture
-async def tmux_session(tmux_session_name: str) -> AsyncGenerator[TmuxSession, None]:
-    """Create and manage a tmux session for testing.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tmux_pool() -> AsyncGenerator[TmuxSessionPool, None]:
+    """Pre-create tmux sessions shared by the whole test session.
 
-    Automatically creates the session on entry and kills it on exit.
+    Each xdist worker runs one test at a time, so one pooled session per
+    worker process is enough. Sessions are killed at the end of the run.
     """
     if not TmuxSession.is_available():
         pytest.skip("tmux not available")
 
-    session = TmuxSession(name=tmux_session_name)
-    async with session:
+    pool = TmuxSessionPool(prefix=f"ralph-e2e-pool-{uuid.uuid4().hex[:8]}", size=1)
+    await pool.start()
+    yield pool
+    await pool.close()
+
+
+@pytest_asyncio.fixture
+async def tmux_session(tmux_pool: TmuxSessionPool) -> AsyncGenerator[TmuxSession, None]:
+    """Borrow a tmux session from the pool for testing.
+
+    The session is reset to a fresh shell and returned to the pool on exit.
+    """
+    session = await tmux_pool.acquire()
+    try:
         yield session
+    finally:
+        await tmux_pool.release(session)
 
 
 @pytest.fixture
@@ -103,21 +187,25 @@ def freeze_capture(evidence_dir: Path) -> FreezeCapture:
     if not FreezeCapture.is_available():
         pytest.skip("freeze CLI not available")
 
-    return FreezeCapture(output_dir=evidence_dir)
+    return FreezeCapture(output_dir=evidence_dir, worker_id=_xdist_worker_id())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_judge() -> LLMJudge:
-    """Create an LLMJudge instance for validation."""
+    """Create an LLMJudge instance shared by all tests for validation."""
     if not LLMJudge.is_available():
         pytest.skip("Claude Agent SDK not available")
 
     return LLMJudge()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ralph_config_path(project_root: Path) -> Path:
-    """Get a valid Ralph config file path."""
+    """Get a valid Ralph config file path.
+
+    Resolved once per session; the candidate scan and fallback write
+    are not repeated for every test.
+    """
     # Look for common config files
     candidates = [
         "ralph.yml",
@@ -126,10 +214,10 @@ def ralph_config_path(project_root: Path) -> Path:
         ".ralph.yml",
     ]
 
+    existing = _root_file_names(project_root)
     for candidate in candidates:
-        config_path = project_root / candidate
-        if config_path.exists():
-            return config_path
+        if candidate in existing:
+            return project_root / candidate
 
     # Create a minimal config for testing
     test_config = project_root / "ralph.test.yml"
@@ -154,15 +242,20 @@ orchestrator:
 def iteration_evidence_base_dir(project_root: Path) -> Path:
     """Get the base evidence directory for iteration lifecycle tests."""
     evidence_dir = project_root / "tui-validation" / "iteration-lifecycle"
+    worker_id = _xdist_worker_id()
+    if worker_id:
+        evidence_dir = evidence_dir / worker_id
     evidence_dir.mkdir(parents=True, exist_ok=True)
     return evidence_dir
 
 
-@pytest.fixture
-def iteration_evidence_dir(iteration_evidence_base_dir: Path) -> Path:
-    """Get a timestamped evidence directory for this test run."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    run_dir = iteration_evidence_base_dir / f"run_{timestamp}"
+@pytest.fixture(scope="session")
+def iteration_evidence_dir(iteration_evidence_base_dir: Path, run_timestamp: str) -> Path:
+    """Get the timestamped evidence directory for this test run.
+
+    Shared by every test in the session so they land in one run directory.
+    """
+    run_dir = iteration_evidence_base_dir / f"run_{run_timestamp}"
     run_dir.mkdir(parents=True, exist_ok=True)
     return run_dir
 
@@ -185,7 +278,7 @@ def iteration_freeze_capture(iteration_evidence_dir: Path) -> FreezeCapture:
     if not FreezeCapture.is_available():
         pytest.skip("freeze CLI not available")
 
-    return FreezeCapture(output_dir=iteration_evidence_dir)
+    return FreezeCapture(output_dir=iteration_evidence_dir, worker_id=_xdist_worker_id())
 
 
 def create_iteration_test_config(
@@ -216,7 +309,10 @@ event_loop:
   max_runtime_seconds: {max_runtime_seconds}
   idle_timeout_secs: {idle_timeout_secs}
 """
-    config_path = project_root / "ralph.iteration-test.yml"
+    # Per-worker filename: configs differ per test and are unlinked on teardown
+    worker_id = _xdist_worker_id()
+    suffix = f".{worker_id}" if worker_id else ""
+    config_path = project_root / f"ralph.iteration-test{suffix}.yml"
     config_path.write_text(config_content)
     return config_path
 
@@ -1,11 +1,12 @@
 # Helper modules for E2E tests
-from .tmux import TmuxSession
+from .tmux import TmuxSession, TmuxSessionPool
 from .freeze import FreezeCapture, CaptureResult
 from .llm_judge import LLMJudge, JudgeResult
 from .iteration_capture import IterationCapture, IterationState, CaptureSequenceResult
 
 __all__ = [
     "TmuxSession",
+    "TmuxSessionPool",
     "FreezeCapture",
     "CaptureResult",
     "LLMJudge",
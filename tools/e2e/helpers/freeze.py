@@ -1,17 +1,50 @@
 """Freeze terminal capture utilities for TUI validation."""
 
 import asyncio
+import functools
+import shutil
 import subprocess
 import tempfile
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Literal
-from datetime import datetime
+
+try:
+    # cairocffi raises OSError when the cairo system library is missing
+    import cairosvg
+    _CAIROSVG_AVAILABLE = True
+except (ImportError, OSError):
+    _CAIROSVG_AVAILABLE = False
 
 
 OutputFormat = Literal["svg", "png", "text"]
 
 
+@functools.lru_cache(maxsize=None)
+def _freeze_available(strict: bool = False) -> bool:
+    """Probe for the freeze CLI; cached so it runs once per process.
+
+    Args:
+        strict: Also run `freeze --version` to check the binary actually works,
+                rather than only looking it up on PATH
+    """
+    if shutil.which("freeze") is None:
+        return False
+    if not strict:
+        return True
+
+    try:
+        result = subprocess.run(
+            ["freeze", "--version"],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0
+    except OSError:
+        return False
+
+
 @dataclass
 class CaptureResult:
     """Result of a freeze capture operation."""
@@ -19,7 +52,14 @@ class CaptureResult:
     text_path: Path
     svg_path: Optional[Path]
     png_path: Optional[Path]
-    raw_content: str
+    _raw_content: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def raw_content(self) -> str:
+        """Captured terminal content, read from text_path on first access."""
+        if self._raw_content is None:
+            self._raw_content = self.text_path.read_text()
+        return self._raw_content
 
 
 class FreezeCapture:
@@ -28,13 +68,25 @@ class FreezeCapture:
     Uses charmbracelet/freeze for high-fidelity terminal screenshots.
     """
 
-    def __init__(self, output_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        worker_id: Optional[str] = None,
+        rasterize_png: bool = False,
+    ):
         """Initialize freeze capture.
 
         Args:
             output_dir: Directory to save captures. Defaults to temp directory.
+            worker_id: Tag added to filenames so parallel writers sharing
+                       output_dir don't collide (e.g. the xdist worker id)
+            rasterize_png: Opt in to rasterizing PNGs from the freeze SVG with
+                           cairosvg (if installed) instead of a second freeze
+                           run. Output may differ from freeze's own PNG.
         """
         self.output_dir = output_dir or Path(tempfile.gettempdir())
+        self.worker_id = worker_id
+        self.rasterize_png = rasterize_png
 
     async def capture_buffer(
         self,
@@ -52,32 +104,35 @@ class FreezeCapture:
         Returns:
             CaptureResult with paths to generated files
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = f"{name_prefix}_{timestamp}"
+        result = await self.capture_buffer_bytes(content.encode(), name_prefix, formats)
+        result._raw_content = content
+        return result
 
-        # Always save raw text
-        text_path = self.output_dir / f"{base_name}.txt"
-        text_path.write_text(content)
+    async def capture_buffer_bytes(
+        self,
+        content: bytes,
+        name_prefix: str = "capture",
+        formats: tuple[OutputFormat, ...] = ("svg", "png", "text"),
+    ) -> CaptureResult:
+        """Capture a raw byte buffer to screenshot.
 
-        svg_path = None
-        png_path = None
+        Writes the bytes as-is, so content straight from
+        TmuxSession.capture_pane_bytes() is never decoded.
 
-        # Generate SVG if requested
-        if "svg" in formats:
-            svg_path = self.output_dir / f"{base_name}.svg"
-            await self._run_freeze(text_path, svg_path, "svg")
+        Args:
+            content: The terminal content (may include ANSI codes)
+            name_prefix: Prefix for output filenames
+            formats: Output formats to generate
 
-        # Generate PNG if requested
-        if "png" in formats:
-            png_path = self.output_dir / f"{base_name}.png"
-            await self._run_freeze(text_path, png_path, "png")
+        Returns:
+            CaptureResult with paths to generated files
+        """
+        # Always save raw text (off the event loop - file I/O blocks)
+        base_name = f"{name_prefix}_{self._stamp()}"
+        text_path = self.output_dir / f"{base_name}.txt"
+        await asyncio.to_thread(text_path.write_bytes, content)
 
-        return CaptureResult(
-            text_path=text_path,
-            svg_path=svg_path,
-            png_path=png_path,
-            raw_content=content,
-        )
+        return await self._render(text_path, base_name, formats)
 
     async def capture_file(
         self,
@@ -87,6 +142,13 @@ class FreezeCapture:
     ) -> CaptureResult:
         """Capture an existing file to screenshot.
 
+        A file already in the output directory is rendered in place and
+        becomes the result's text_path; it is not snapshotted, so later
+        writes to it change the evidence. Any other file is copied into the
+        output directory (without decoding it) and the copy is rendered.
+        Images are always named with name_prefix and a unique stamp, so no
+        existing files are overwritten.
+
         Args:
             input_path: Path to file containing terminal output
             name_prefix: Prefix for output filenames
@@ -95,8 +157,73 @@ class FreezeCapture:
         Returns:
             CaptureResult with paths to generated files
         """
-        content = input_path.read_text()
-        return await self.capture_buffer(content, name_prefix, formats)
+        base_name = f"{name_prefix}_{self._stamp()}"
+        if input_path.parent.resolve() == self.output_dir.resolve():
+            text_path = input_path
+        else:
+            text_path = self.output_dir / f"{base_name}.txt"
+            await asyncio.to_thread(shutil.copyfile, input_path, text_path)
+
+        return await self._render(text_path, base_name, formats)
+
+    def _stamp(self) -> str:
+        """Get a unique suffix for capture filenames.
+
+        Uses a nanosecond monotonic clock, so captures in the same second
+        don't overwrite each other, prefixed with the worker id if set.
+        """
+        stamp = str(time.monotonic_ns())
+        return f"{self.worker_id}_{stamp}" if self.worker_id else stamp
+
+    async def _render(
+        self,
+        text_path: Path,
+        base_name: str,
+        formats: tuple[OutputFormat, ...],
+    ) -> CaptureResult:
+        """Render a saved text capture to the requested image formats.
+
+        Args:
+            text_path: Path to the saved terminal content
+            base_name: Output filename without extension
+            formats: Output formats to generate
+
+        Returns:
+            CaptureResult with paths to generated files
+        """
+        svg_path = None
+        png_path = None
+        renders = []
+
+        # Generate SVG if requested
+        if "svg" in formats:
+            svg_path = self.output_dir / f"{base_name}.svg"
+            renders.append(self._run_freeze(text_path, svg_path, "svg"))
+
+        # Generate PNG if requested - by a second freeze run, or rasterized
+        # from the SVG in-process when opted in and cairosvg is usable
+        rasterize = (
+            self.rasterize_png
+            and "png" in formats
+            and svg_path is not None
+            and _CAIROSVG_AVAILABLE
+        )
+        if "png" in formats:
+            png_path = self.output_dir / f"{base_name}.png"
+            if not rasterize:
+                renders.append(self._run_freeze(text_path, png_path, "png"))
+
+        # Renders are independent freeze processes - run them concurrently
+        await asyncio.gather(*renders)
+
+        if rasterize:
+            await self._rasterize(svg_path, png_path)
+
+        return CaptureResult(
+            text_path=text_path,
+            svg_path=svg_path,
+            png_path=png_path,
+        )
 
     async def _run_freeze(
         self,
@@ -135,15 +262,31 @@ class FreezeCapture:
                 f"freeze {output_format} generation failed: {stderr.decode()}"
             )
 
-    @staticmethod
-    def is_available() -> bool:
-        """Check if freeze CLI is available on the system."""
+    async def _rasterize(self, svg_path: Path, png_path: Path) -> None:
+        """Rasterize a freeze SVG to PNG with cairosvg.
+
+        Args:
+            svg_path: Path to the rendered SVG
+            png_path: Path for the PNG output
+        """
         try:
-            result = subprocess.run(
-                ["freeze", "--version"],
-                capture_output=True,
-                text=True,
+            await asyncio.to_thread(
+                cairosvg.svg2png, url=str(svg_path), write_to=str(png_path)
             )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        except Exception as e:
+            # Same policy as freeze: a missing PNG shouldn't fail the test
+            import logging
+            logging.warning(f"cairosvg png rasterization failed: {e}")
+
+    @staticmethod
+    def is_available(strict: bool = False) -> bool:
+        """Check if freeze CLI is available on the system.
+
+        Args:
+            strict: Run the binary to verify it works instead of only
+                    checking PATH
+
+        Returns:
+            True if the freeze CLI is available
+        """
+        return _freeze_available(strict)
@@ -2,10 +2,24 @@
 
 import asyncio
 import json
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Any
 
+try:
+    from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, TextBlock
+    _SDK_AVAILABLE = True
+except ImportError:
+    _SDK_AVAILABLE = False
+
+
+# Markdown code fences around the JSON payload; a ```json fence takes
+# precedence over a plain one. The closing fence is optional because streamed
+# responses are cut off right after the JSON object.
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*(?:```|\Z)", re.DOTALL)
+_FENCE_RE = re.compile(r"```\s*(.*?)\s*(?:```|\Z)", re.DOTALL)
+
 
 @dataclass
 class CheckResult:
@@ -173,6 +187,44 @@ Respond with ONLY valid JSON (no markdown, no extra text):
 """
 
 
+def _json_object_end(text: str) -> Optional[int]:
+    """Find the end of the first balanced JSON object in text.
+
+    Tracks brace depth, ignoring braces inside JSON strings.
+
+    Args:
+        text: Text that may contain a JSON object
+
+    Returns:
+        Index just past the object's closing brace, or None if incomplete
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
 class LLMJudge:
     """Validates TUI output using Claude as an LLM-as-judge.
 
@@ -187,6 +239,9 @@ class LLMJudge:
                    Defaults to Haiku for speed/cost.
         """
         self.model = model
+        # SDK options are built on first use and reused for every query
+        self._text_options: Optional[Any] = None
+        self._image_options: Optional[Any] = None
 
     async def validate(
         self,
@@ -202,7 +257,8 @@ class LLMJudge:
         Returns:
             JudgeResult with validation outcome
         """
-        from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, TextBlock
+        if not _SDK_AVAILABLE:
+            raise RuntimeError("Claude Agent SDK not available. Install claude-agent-sdk.")
 
         prompt = f"""{criteria}
 
@@ -211,18 +267,13 @@ TERMINAL OUTPUT TO ANALYZE:
 {content}
 ```"""
 
-        options = ClaudeAgentOptions(
-            model=self.model,
-            max_turns=1,
-        )
-
-        response_text = ""
-        async for message in query(prompt=prompt, options=options):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        response_text += block.text
+        if self._text_options is None:
+            self._text_options = ClaudeAgentOptions(
+                model=self.model,
+                max_turns=1,
+            )
 
+        response_text = await self._collect_response(prompt, self._text_options)
         return self._parse_response(response_text)
 
     async def validate_image(
@@ -239,28 +290,53 @@ TERMINAL OUTPUT TO ANALYZE:
         Returns:
             JudgeResult with validation outcome
         """
-        from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, TextBlock
+        if not _SDK_AVAILABLE:
+            raise RuntimeError("Claude Agent SDK not available. Install claude-agent-sdk.")
 
         prompt = f"""{criteria}
 
 Please read and analyze the image at: {image_path}
 """
 
-        options = ClaudeAgentOptions(
-            model=self.model,
-            max_turns=2,  # One turn to read image, one to respond
-            allowed_tools=["Read"],  # Allow reading the image file
-        )
-
-        response_text = ""
-        async for message in query(prompt=prompt, options=options):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        response_text += block.text
+        if self._image_options is None:
+            self._image_options = ClaudeAgentOptions(
+                model=self.model,
+                max_turns=2,  # One turn to read image, one to respond
+                allowed_tools=["Read"],  # Allow reading the image file
+            )
 
+        response_text = await self._collect_response(prompt, self._image_options)
         return self._parse_response(response_text)
 
+    async def _collect_response(self, prompt: str, options: Any) -> str:
+        """Stream the SDK response until a complete JSON object has arrived.
+
+        Stops reading (and closes the stream) as soon as the text contains a
+        balanced JSON object, so trailing commentary isn't waited for.
+
+        Args:
+            prompt: Prompt to send
+            options: ClaudeAgentOptions for the query
+
+        Returns:
+            Response text received up to the end of the JSON object
+        """
+        response_text = ""
+        stream = query(prompt=prompt, options=options)
+        try:
+            async for message in stream:
+                if isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            response_text += block.text
+                    end = _json_object_end(response_text)
+                    if end is not None:
+                        return response_text[:end]
+        finally:
+            await stream.aclose()
+
+        return response_text
+
     def _parse_response(self, response: str) -> JudgeResult:
         """Parse LLM response into structured JudgeResult.
 
@@ -273,13 +349,10 @@ Please read and analyze the image at: {image_path}
         # Try to extract JSON from response
         try:
             # Handle potential markdown code blocks
-            json_str = response
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
+            match = _JSON_FENCE_RE.search(response) or _FENCE_RE.search(response)
+            json_str = match.group(1) if match else response.strip()
 
-            data = json.loads(json_str.strip())
+            data = json.loads(json_str)
 
             checks = {}
             if "checks" in data:
@@ -307,8 +380,4 @@ Please read and analyze the image at: {image_path}
     @staticmethod
     def is_available() -> bool:
         """Check if Claude Agent SDK is available."""
-        try:
-            import claude_agent_sdk
-            return True
-        except ImportError:
-            return False
+        return _SDK_AVAILABLE
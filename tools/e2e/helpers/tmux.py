@@ -1,11 +1,37 @@
 """Tmux session management for E2E testing."""
 
 import asyncio
+import functools
+import shutil
 import subprocess
 from dataclasses import dataclass
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=None)
+def _tmux_available(strict: bool = False) -> bool:
+    """Probe for tmux; cached so it runs once per process.
+
+    Args:
+        strict: Also run `tmux -V` to check the binary actually works,
+                rather than only looking it up on PATH
+    """
+    if shutil.which("tmux") is None:
+        return False
+    if not strict:
+        return True
+
+    try:
+        result = subprocess.run(
+            ["tmux", "-V"],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0
+    except OSError:
+        return False
+
+
 @dataclass
 class TmuxSession:
     """Manages a tmux session for controlled terminal testing.
@@ -17,16 +43,11 @@ class TmuxSession:
     width: int = 100
     height: int = 30
     _created: bool = False
+    _deferred: bool = False
 
     async def create(self) -> None:
         """Create a new tmux session with fixed dimensions."""
-        cmd = [
-            "tmux", "new-session",
-            "-d",  # detached
-            "-s", self.name,
-            "-x", str(self.width),
-            "-y", str(self.height),
-        ]
+        cmd = ["tmux", *self._new_session_args()]
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
@@ -38,20 +59,53 @@ class TmuxSession:
             raise RuntimeError(f"Failed to create tmux session: {stderr.decode()}")
 
         self._created = True
+        self._deferred = False
+
+    async def create_and_send(self, keys: str, enter: bool = True) -> None:
+        """Create the session and send keys to it in a single tmux call.
+
+        Chains new-session and send-keys with tmux's ";" separator, saving
+        one subprocess over create() followed by send_keys().
+
+        Args:
+            keys: The keys/command to send
+            enter: Whether to send Enter after the keys
+        """
+        cmd = ["tmux", *self._new_session_args(), ";", *self._send_keys_args(keys, enter)]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+
+        # new-session may have succeeded even if send-keys failed; mark the
+        # session created so kill() cleans it up either way
+        self._created = True
+        self._deferred = False
+
+        if proc.returncode != 0:
+            await self.kill()
+            raise RuntimeError(f"Failed to create tmux session: {stderr.decode()}")
 
     async def send_keys(self, keys: str, enter: bool = True) -> None:
         """Send keys to the tmux session.
 
+        If session creation was deferred by the context manager, the session
+        is created in the same tmux call.
+
         Args:
             keys: The keys/command to send
             enter: Whether to send Enter after the keys
         """
+        if self._deferred:
+            await self.create_and_send(keys, enter)
+            return
+
         if not self._created:
             raise RuntimeError("Session not created. Call create() first.")
 
-        cmd = ["tmux", "send-keys", "-t", self.name, keys]
-        if enter:
-            cmd.append("Enter")
+        cmd = ["tmux", *self._send_keys_args(keys, enter)]
 
         proc = await asyncio.create_subprocess_exec(
             *cmd,
@@ -74,13 +128,30 @@ class TmuxSession:
         Returns:
             The captured pane content as a string
         """
+        return (await self.capture_pane_bytes(preserve_ansi)).decode()
+
+    async def capture_pane_bytes(self, preserve_ansi: bool = True) -> bytes:
+        """Capture the current visible pane content without decoding it.
+
+        Use this when the content is only written back out (e.g. to freeze),
+        to skip a decode/encode round-trip. See capture_pane() for details.
+
+        Args:
+            preserve_ansi: Whether to preserve ANSI escape sequences
+
+        Returns:
+            The captured pane content as raw bytes
+        """
+        if self._deferred:
+            await self.create()
+
         if not self._created:
             raise RuntimeError("Session not created. Call create() first.")
 
         # Capture the current visible content (works for both normal and alternate screen TUIs)
         return await self._capture_with_flags(preserve_ansi, use_alternate=False)
 
-    async def _capture_with_flags(self, preserve_ansi: bool, use_alternate: bool) -> str:
+    async def _capture_with_flags(self, preserve_ansi: bool, use_alternate: bool) -> bytes:
         """Internal helper to capture pane with specific flags."""
         cmd = ["tmux", "capture-pane", "-p", "-t", self.name]
         if preserve_ansi:
@@ -94,7 +165,51 @@ class TmuxSession:
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, _ = await proc.communicate()
-        return stdout.decode()
+        return stdout
+
+    async def capture_and_kill(self, preserve_ansi: bool = True) -> str:
+        """Capture the visible pane content and kill the session in one tmux call.
+
+        Args:
+            preserve_ansi: Whether to preserve ANSI escape sequences
+
+        Returns:
+            The captured pane content as a string
+        """
+        return (await self.capture_and_kill_bytes(preserve_ansi)).decode()
+
+    async def capture_and_kill_bytes(self, preserve_ansi: bool = True) -> bytes:
+        """Capture the pane without decoding it and kill the session in one tmux call.
+
+        Args:
+            preserve_ansi: Whether to preserve ANSI escape sequences
+
+        Returns:
+            The captured pane content as raw bytes
+        """
+        if self._deferred:
+            await self.create()
+
+        if not self._created:
+            raise RuntimeError("Session not created. Call create() first.")
+
+        cmd = ["tmux", "capture-pane", "-p", "-t", self.name]
+        if preserve_ansi:
+            cmd.insert(2, "-e")  # -e preserves escape sequences
+        cmd += [";", "kill-session", "-t", self.name]
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to capture and kill tmux session: {stderr.decode()}")
+
+        self._created = False
+        return stdout
 
     async def wait_for_alternate_screen(self, timeout: float = 30.0, poll_interval: float = 0.5) -> bool:
         """Wait for a TUI app to start rendering content.
@@ -128,6 +243,7 @@ class TmuxSession:
 
     async def kill(self) -> None:
         """Kill the tmux session."""
+        self._deferred = False
         if not self._created:
             return
 
@@ -140,24 +256,151 @@ class TmuxSession:
         await proc.communicate()
         self._created = False
 
+    async def reset(self) -> None:
+        """Reset the session to a fresh shell without recreating it.
+
+        Kills whatever is running in the pane, starts a new shell, and drops
+        the scrollback, so the session can be reused by another test.
+        """
+        if not self._created:
+            raise RuntimeError("Session not created. Call create() first.")
+
+        cmd = [
+            "tmux", "respawn-pane", "-k", "-t", self.name,
+            ";", "clear-history", "-t", self.name,
+        ]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to reset tmux session: {stderr.decode()}")
+
     async def __aenter__(self) -> "TmuxSession":
-        """Async context manager entry."""
-        await self.create()
+        """Async context manager entry.
+
+        Creation is deferred until the first send_keys() (or capture) so it
+        can share a tmux call with the first command.
+        """
+        self._deferred = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit - ensures cleanup."""
         await self.kill()
 
+    def _new_session_args(self) -> list[str]:
+        """Build tmux arguments for creating this session."""
+        return [
+            "new-session",
+            "-d",  # detached
+            "-s", self.name,
+            "-x", str(self.width),
+            "-y", str(self.height),
+        ]
+
+    def _send_keys_args(self, keys: str, enter: bool) -> list[str]:
+        """Build tmux arguments for sending keys to this session."""
+        # tmux treats an argument ending in ";" as a command separator
+        if keys.endswith(";"):
+            keys = keys[:-1] + "\\;"
+
+        args = ["send-keys", "-t", self.name, keys]
+        if enter:
+            args.append("Enter")
+        return args
+
     @staticmethod
-    def is_available() -> bool:
-        """Check if tmux is available on the system."""
+    def is_available(strict: bool = False) -> bool:
+        """Check if tmux is available on the system.
+
+        Args:
+            strict: Run the binary to verify it works instead of only
+                    checking PATH
+
+        Returns:
+            True if tmux is available
+        """
+        return _tmux_available(strict)
+
+
+class TmuxSessionPool:
+    """Pool of pre-created tmux sessions reused across tests.
+
+    Sessions are created once and reset between tests instead of being
+    killed and recreated, so the tmux server and sessions start only once.
+    """
+
+    def __init__(self, prefix: str, size: int = 1, width: int = 100, height: int = 30):
+        """Initialize the pool.
+
+        Args:
+            prefix: Session name prefix; must be unique to this pool
+            size: Number of sessions to pre-create
+            width: Session width in columns
+            height: Session height in rows
+        """
+        self.sessions = [
+            TmuxSession(name=f"{prefix}-{i}", width=width, height=height)
+            for i in range(size)
+        ]
+        self._queue: asyncio.Queue[TmuxSession] = asyncio.Queue()
+
+    async def start(self) -> None:
+        """Create all sessions and make them available."""
+        await asyncio.gather(*(session.create() for session in self.sessions))
+        for session in self.sessions:
+            self._queue.put_nowait(session)
+
+    async def acquire(self, timeout: float = 60.0) -> TmuxSession:
+        """Take a session from the pool, waiting if all are in use.
+
+        Args:
+            timeout: Maximum time to wait for a session in seconds
+
+        Raises:
+            RuntimeError: If no session is returned to the pool in time
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                f"No pooled tmux session became available within {timeout}s"
+            ) from None
+
+    async def release(self, session: TmuxSession) -> None:
+        """Reset a session and return it to the pool.
+
+        The session always goes back on the queue. If it can't be reset
+        (e.g. its shell or the tmux server died) it is recreated instead.
+
+        Raises:
+            RuntimeError: If the borrower killed the session. It is recreated
+                first so the pool stays usable, but pooled sessions must not
+                be killed (use capture_pane, not capture_and_kill).
+        """
+        killed = not session._created
         try:
-            result = subprocess.run(
-                ["tmux", "-V"],
-                capture_output=True,
-                text=True,
+            if killed:
+                await session.create()
+            else:
+                try:
+                    await session.reset()
+                except Exception:
+                    await session.kill()
+                    await session.create()
+        finally:
+            self._queue.put_nowait(session)
+
+        if killed:
+            raise RuntimeError(
+                f"Pooled tmux session {session.name} was killed by its borrower; "
+                "use capture_pane() instead of capture_and_kill()"
             )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+
+    async def close(self) -> None:
+        """Kill all sessions in the pool."""
+        await asyncio.gather(*(session.kill() for session in self.sessions))
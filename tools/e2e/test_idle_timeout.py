@@ -9,8 +9,11 @@ These tests validate that:
 
 import asyncio
 import json
+import re
+import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
@@ -18,6 +21,13 @@ from .helpers import TmuxSession, FreezeCapture, LLMJudge, JudgeResult
 from .helpers.llm_judge import IDLE_TIMEOUT_CRITERIA
 
 
+# Echoed after the Ralph command so its exit shows up in the pane whatever the
+# shell prompt looks like. The echoed command line has a literal "$?", so
+# only the expanded output matches the pattern.
+EXIT_SENTINEL = "__RALPH_EXIT_$?__"
+EXIT_SENTINEL_RE = re.compile(r"__RALPH_EXIT_(\d+)__")
+
+
 @pytest.mark.asyncio
 @pytest.mark.e2e
 @pytest.mark.requires_tmux
@@ -30,6 +40,7 @@ async def test_idle_timeout_triggers_after_inactivity(
     ralph_binary: Path,
     ralph_config_path: Path,
     evidence_dir: Path,
+    request: pytest.FixtureRequest,
 ):
     """Test that idle timeout triggers correctly and TUI captures properly.
 
@@ -49,28 +60,29 @@ async def test_idle_timeout_triggers_after_inactivity(
         f'-p "Say hello and nothing else"'
     )
 
-    # Start Ralph in the tmux session
-    await tmux_session.send_keys(cmd)
+    # Start Ralph in the tmux session, echoing a sentinel when it exits
+    await tmux_session.send_keys(f"{cmd}; echo {EXIT_SENTINEL}")
 
     # Wait for Claude to respond and idle timeout to trigger
-    # 5s timeout + ~5s buffer for response + cleanup
-    await asyncio.sleep(12)
+    # 5s timeout + ~5s buffer for response + cleanup, returning early on exit
+    await _wait_for_idle(tmux_session, deadline=12.0)
 
     # Capture the final TUI state
-    raw_output = await tmux_session.capture_pane()
+    raw_bytes = await tmux_session.capture_pane_bytes()
 
-    # Create screenshot with freeze
-    capture_result = await freeze_capture.capture_buffer(
-        raw_output,
+    # Create screenshot with freeze (bytes go to disk without a decode)
+    capture_result = await freeze_capture.capture_buffer_bytes(
+        raw_bytes,
         name_prefix="idle_timeout",
         formats=("svg", "png", "text"),
     )
 
     # Validate with LLM-as-judge
+    raw_output = raw_bytes.decode()
     judge_result = await llm_judge.validate(raw_output, IDLE_TIMEOUT_CRITERIA)
 
     # Save evidence
-    _save_evidence(evidence_dir, capture_result, judge_result)
+    await _save_evidence(evidence_dir, capture_result, judge_result, request.node.name)
 
     # Assert validation passed
     assert judge_result.passed, (
@@ -80,11 +92,188 @@ async def test_idle_timeout_triggers_after_inactivity(
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.e2e
+@pytest.mark.concurrent_probes
+@pytest.mark.requires_tmux
+@pytest.mark.requires_freeze
+@pytest.mark.requires_claude
+async def test_e2e_probes_concurrent(
+    tmux_session: TmuxSession,
+    freeze_capture: FreezeCapture,
+    llm_judge: LLMJudge,
+):
+    """Test tmux, freeze, and LLM judge integration concurrently.
+
+    The probes are independent, so they run concurrently and the test
+    takes as long as the slowest probe. Skipped unless all three tools are
+    available, in which case the per-probe variants below run instead.
+    """
+    await _gather_or_cancel(
+        _probe_tmux(tmux_session),
+        _probe_freeze(freeze_capture),
+        _probe_judge(llm_judge),
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.e2e
 @pytest.mark.requires_tmux
+async def test_tmux_fused_create_and_capture():
+    """Test the chained tmux calls used by a context-managed TmuxSession.
+
+    send_keys() on a fresh session goes through create_and_send(), and
+    capture_and_kill() captures and tears down in one call. The trailing
+    ";" checks that keys ending in a separator are escaped.
+    """
+    if not TmuxSession.is_available():
+        pytest.skip("tmux not available")
+
+    name = f"ralph-e2e-fused-{uuid.uuid4().hex[:8]}"
+    async with TmuxSession(name=name) as session:
+        await session.send_keys("echo fused-ok;")
+
+        # Wait for the shell to run the command, not just echo the keys
+        for _ in range(20):
+            content = await session.capture_pane(preserve_ansi=False)
+            if any(line.strip() == "fused-ok" for line in content.splitlines()):
+                break
+            await asyncio.sleep(0.25)
+
+        output = await session.capture_and_kill(preserve_ansi=False)
+
+    assert any(line.strip() == "fused-ok" for line in output.splitlines()), output
+
+    proc = await asyncio.create_subprocess_exec(
+        "tmux", "has-session", "-t", name,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    await proc.communicate()
+    assert proc.returncode != 0, "capture_and_kill() should have killed the session"
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+@pytest.mark.serial
+@pytest.mark.requires_tmux
 async def test_tmux_session_captures_output(tmux_session: TmuxSession):
     """Test that tmux session can capture command output."""
+    await _probe_tmux(tmux_session)
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+@pytest.mark.serial
+@pytest.mark.requires_freeze
+async def test_freeze_capture_produces_files(freeze_capture: FreezeCapture):
+    """Test that freeze produces valid output files."""
+    await _probe_freeze(freeze_capture)
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+@pytest.mark.serial
+@pytest.mark.requires_claude
+async def test_llm_judge_validates_content(llm_judge: LLMJudge):
+    """Test that LLM judge can validate terminal content."""
+    await _probe_judge(llm_judge)
+
+
+@pytest.mark.asyncio
+@pytest.mark.e2e
+async def test_evidence_directory_structure(evidence_dir: Path):
+    """Test that evidence directory is created with proper structure."""
+    assert evidence_dir.exists()
+    assert evidence_dir.is_dir()
+
+    # Verify we can write to it
+    test_file = evidence_dir / "test_write.txt"
+    test_file.write_text("test")
+    assert test_file.exists()
+    test_file.unlink()  # Clean up
+
+
+async def _gather_or_cancel(*coros) -> list:
+    """Run coroutines concurrently, cancelling the rest if one fails.
+
+    Plain asyncio.gather leaves the other tasks running after a failure;
+    on the shared session event loop they would outlive the test and keep
+    using its (by then recycled) fixtures.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _wait_for_idle(
+    tmux_session: TmuxSession,
+    deadline: float = 12.0,
+    poll_interval: float = 0.5,
+) -> Optional[int]:
+    """Wait for Ralph to exit, up to a hard deadline.
+
+    The command must have been sent followed by `echo EXIT_SENTINEL`; Ralph
+    is done once the expanded sentinel appears in the pane. Falls through at
+    the deadline either way, so the caller captures whatever state the pane
+    is in.
+
+    Returns:
+        Ralph's exit code, or None if the deadline passed first
+    """
+    async def poll() -> int:
+        while True:
+            content = await tmux_session.capture_pane(preserve_ansi=False)
+            match = EXIT_SENTINEL_RE.search(content)
+            if match:
+                return int(match.group(1))
+            await asyncio.sleep(poll_interval)
+
+    try:
+        return await asyncio.wait_for(poll(), timeout=deadline)
+    except asyncio.TimeoutError:
+        return None
+
+
+async def _save_evidence(
+    evidence_dir: Path,
+    capture_result,
+    judge_result: JudgeResult,
+    test_name: str,
+) -> None:
+    """Save all evidence files for the test run."""
+    # Append judge result as one JSON line; one file per run, not per test
+    judge_path = evidence_dir / "judge_results.jsonl"
+    record = {
+        "ts": datetime.now().isoformat(),
+        "test": test_name,
+        **judge_result.to_dict(),
+    }
+    await asyncio.to_thread(_append_line, judge_path, json.dumps(record))
+
+    # Log evidence locations
+    print(f"\nEvidence saved to: {evidence_dir}")
+    print(f"  - Text: {capture_result.text_path}")
+    if capture_result.svg_path:
+        print(f"  - SVG: {capture_result.svg_path}")
+    if capture_result.png_path:
+        print(f"  - PNG: {capture_result.png_path}")
+    print(f"  - Judge: {judge_path}")
+
+
+def _append_line(path: Path, line: str) -> None:
+    """Append a single line to a file."""
+    with path.open("a") as f:
+        f.write(line + "\n")
+
+
+async def _probe_tmux(tmux_session: TmuxSession) -> None:
+    """Check that a tmux session can capture command output."""
     # Send a simple command
     await tmux_session.send_keys("echo 'Hello from tmux test'")
 
@@ -98,14 +287,8 @@ async def test_tmux_session_captures_output(tmux_session: TmuxSession):
     assert "Hello from tmux test" in output
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.requires_freeze
-async def test_freeze_capture_produces_files(
-    freeze_capture: FreezeCapture,
-    evidence_dir: Path,
-):
-    """Test that freeze produces valid output files."""
+async def _probe_freeze(freeze_capture: FreezeCapture) -> None:
+    """Check that freeze produces valid output files."""
     test_content = """
 ╭─────────────────────────────────────────────╮
 │ [iter 1] 00:05 | 🔨 Test | ▶ auto          │
@@ -136,11 +319,8 @@ async def test_freeze_capture_produces_files(
     assert "Hello, this is a test" in saved_text
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.requires_claude
-async def test_llm_judge_validates_content(llm_judge: LLMJudge):
-    """Test that LLM judge can validate terminal content."""
+async def _probe_judge(llm_judge: LLMJudge) -> None:
+    """Check that the LLM judge can validate terminal content."""
     # Sample terminal output that should pass validation
     valid_content = """
 user@machine:~/project$ ralph run --tui --idle-timeout 5 -p "Say hello"
@@ -163,39 +343,3 @@ user@machine:~/project$
     print(f"Reason: {result.overall_reason}")
     for check_name, check in result.checks.items():
         print(f"  {check_name}: {'PASS' if check.passed else 'FAIL'} - {check.reason}")
-
-
-@pytest.mark.asyncio
-@pytest.mark.e2e
-async def test_evidence_directory_structure(evidence_dir: Path):
-    """Test that evidence directory is created with proper structure."""
-    assert evidence_dir.exists()
-    assert evidence_dir.is_dir()
-
-    # Verify we can write to it
-    test_file = evidence_dir / "test_write.txt"
-    test_file.write_text("test")
-    assert test_file.exists()
-    test_file.unlink()  # Clean up
-
-
-def _save_evidence(
-    evidence_dir: Path,
-    capture_result,
-    judge_result: JudgeResult,
-) -> None:
-    """Save all evidence files for the test run."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Save judge result as JSON
-    judge_path = evidence_dir / f"judge_result_{timestamp}.json"
-    judge_path.write_text(json.dumps(judge_result.to_dict(), indent=2))
-
-    # Log evidence locations
-    print(f"\nEvidence saved to: {evidence_dir}")
-    print(f"  - Text: {capture_result.text_path}")
-    if capture_result.svg_path:
-        print(f"  - SVG: {capture_result.svg_path}")
-    if capture_result.png_path:
-        print(f"  - PNG: {capture_result.png_path}")
-    print(f"  - Judge: {judge_path}")
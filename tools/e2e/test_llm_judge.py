@@ -0,0 +1,52 @@
+"""Unit tests for LLM judge response parsing.
+
+These cover the pure parsing helpers, which the SDK-backed E2E tests only
+reach when the Claude Agent SDK is installed.
+"""
+
+from .helpers.llm_judge import LLMJudge, _FENCE_RE, _JSON_FENCE_RE, _json_object_end
+
+
+def test_fence_re_matches_unclosed_fence():
+    """A fence cut off by the streaming early-exit still yields its body."""
+    match = _JSON_FENCE_RE.search('```json\n{"pass": true}')
+    assert match is not None
+    assert match.group(1) == '{"pass": true}'
+
+
+def test_fence_re_matches_plain_fence():
+    """A fence without a language tag yields its body."""
+    match = _FENCE_RE.search('Result:\n```\n{"pass": false}\n```\nDone.')
+    assert match is not None
+    assert match.group(1) == '{"pass": false}'
+
+
+def test_json_object_end_ignores_braces_in_strings():
+    """Braces and escaped quotes inside JSON strings don't affect depth."""
+    text = '{"reason": "saw } and \\" and {", "pass": true} trailing'
+    end = _json_object_end(text)
+    assert text[:end] == '{"reason": "saw } and \\" and {", "pass": true}'
+
+
+def test_json_object_end_skips_leading_prose():
+    """The object is found after prose, and its end index is absolute."""
+    text = 'Here is my verdict: {"checks": {"a": {"pass": true}}} Hope that helps!'
+    end = _json_object_end(text)
+    assert text[:end].endswith('{"pass": true}}}')
+
+
+def test_json_object_end_incomplete():
+    """No end is reported until the object is balanced."""
+    assert _json_object_end('{"checks": {"a": 1}') is None
+    assert _json_object_end("no object here") is None
+
+
+def test_parse_response_prefers_json_fence():
+    """A ```json fence wins over an earlier fence in another language."""
+    response = (
+        "```python\nprint('hi')\n```\n"
+        '```json\n{"pass": false, "overall_reason": "parsed"}\n```'
+    )
+    result = LLMJudge()._parse_response(response)
+    assert result.passed is False
+    assert result.overall_reason == "parsed"